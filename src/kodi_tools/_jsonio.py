@@ -0,0 +1,26 @@
+"""
+Gemeinsames JSON-Lesen/Schreiben für die Kodi-Tools (mit orjson falls installiert)
+"""
+
+import json
+from typing import Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(data: bytes):
+    """Parst JSON direkt aus Bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Dict) -> bytes:
+    """Serialisiert Daten eingerückt als UTF-8 (die Dateien werden auch von Hand bearbeitet)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
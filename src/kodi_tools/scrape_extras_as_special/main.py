@@ -4,33 +4,251 @@ Kodi Custom Special Episodes Generator
 Erstellt NFO-Dateien und Thumbnails für manuell verwaltete Special-Folgen (E1000+)
 """
 
+import io
 import os
-import json
+import errno
 import subprocess
 import shutil
-import xml.etree.ElementTree as ET
+import struct
+from xml.sax.saxutils import escape
+from contextlib import redirect_stdout
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import re
 
+from kodi_tools._jsonio import dump_json, load_json
+
 try:
     from PIL import Image, ImageDraw, ImageFont
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
 
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+# Vorkompilierte Muster für Dateinamen und Label-Erkennung
+_EP_RE = re.compile(r'[Ss](\d+)[Ee](\d+)(?:\s*-\s*(.+))?$')
+_STAFFEL_RE = re.compile(r'(?:staffel|season)\s*0*(\d+)')
+_EPISODE_RE = re.compile(r'episode\s*0*(\d+)')
+_HASH_RE = re.compile(r'#\s*0*(\d+)')
+_QUOTED_RE = re.compile(r"''(.*?)''")
+
+
+# Schriften für Labels in Reihenfolge der Präferenz
+_LABEL_FONTS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "arial.ttf",
+    "Arial.ttf",
+)
+
+
+@lru_cache(maxsize=8)
+def _get_label_font(size: int):
+    """Lädt die erste verfügbare Label-Schrift einmalig pro Schriftgröße"""
+    for path in _LABEL_FONTS:
+        # Absolute Pfade vorab prüfen, relative Namen sucht FreeType in den System-Schriftordnern
+        if os.path.isabs(path) and not os.path.exists(path):
+            continue
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    # Fallback auf Default-Font
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Sucht ffmpeg und ffprobe im PATH, ohne die Programme zu starten"""
+    return shutil.which('ffmpeg') is not None and shutil.which('ffprobe') is not None
+
+
+def _xml_element(tag: str, text: str, indent: str = '  ') -> str:
+    """Erzeugt eine eingerückte NFO-Zeile mit escaptem Text"""
+    if not text:
+        return f"{indent}<{tag} />"
+    return f"{indent}<{tag}>{escape(text)}</{tag}>"
+
+
+def _hms(seconds: float) -> str:
+    """Formatiert Sekunden als ffmpeg-Timestamp 'HH:MM:SS'"""
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def _parse_timestamp(timestamp: str) -> float:
+    """Wandelt einen ffmpeg-Timestamp ('HH:MM:SS', 'MM:SS' oder Sekunden) in Sekunden um"""
+    seconds = 0.0
+    for part in timestamp.strip().split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _read_duration_mp4(path: Path) -> Optional[float]:
+    """Liest die Dauer aus dem 'mvhd'-Atom einer MP4/MOV-Datei"""
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        offset = 0
+        end = file_size
+        # Top-Level-Atome überspringen bis 'moov', darin nach 'mvhd' suchen
+        while offset + 8 <= end:
+            f.seek(offset)
+            header = f.read(16)
+            if len(header) < 8:
+                return None
+            box_size, box_type = struct.unpack('>I4s', header[:8])
+            header_size = 8
+            if box_size == 1:
+                if len(header) < 16:
+                    return None
+                box_size = struct.unpack('>Q', header[8:16])[0]
+                header_size = 16
+            elif box_size == 0:
+                box_size = end - offset
+            if box_size < header_size:
+                return None
+
+            if box_type == b'moov':
+                offset += header_size
+                end = min(end, offset - header_size + box_size)
+                continue
+            if box_type == b'mvhd':
+                f.seek(offset + header_size)
+                data = f.read(32)
+                if len(data) < 20:
+                    return None
+                if data[0] == 1:
+                    if len(data) < 32:
+                        return None
+                    timescale, duration = struct.unpack('>IQ', data[20:32])
+                    unknown = 0xFFFFFFFFFFFFFFFF
+                else:
+                    timescale, duration = struct.unpack('>II', data[12:20])
+                    unknown = 0xFFFFFFFF
+                if not timescale or not duration or duration == unknown:
+                    return None
+                return duration / timescale
+            offset += box_size
+    return None
+
+
+# Matroska/EBML Element-IDs
+_MKV_SEGMENT = 0x18538067
+_MKV_CLUSTER = 0x1F43B675
+_MKV_INFO = 0x1549A966
+_MKV_TIMECODE_SCALE = 0x2AD7B1
+_MKV_DURATION = 0x4489
+
+
+def _read_ebml_vint(f, keep_marker: bool) -> Optional[Tuple[int, int]]:
+    """Liest eine EBML-Zahl variabler Länge: (Wert, Länge in Bytes)"""
+    first = f.read(1)
+    if not first:
+        return None
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first[0] & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        return None
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        return None
+    value = first[0] if keep_marker else first[0] & (mask - 1)
+    for byte in rest:
+        value = (value << 8) | byte
+    return value, length
+
+
+def _read_ebml_header(f) -> Optional[Tuple[int, Optional[int], int]]:
+    """Liest ID und Größe eines EBML-Elements: (ID, Größe oder None wenn unbekannt, Header-Länge)"""
+    element_id = _read_ebml_vint(f, keep_marker=True)
+    size = _read_ebml_vint(f, keep_marker=False)
+    if element_id is None or size is None:
+        return None
+    size_value, size_length = size
+    if size_value == (1 << (7 * size_length)) - 1:
+        size_value = None
+    return element_id[0], size_value, element_id[1] + size_length
+
+
+def _read_duration_mkv(path: Path) -> Optional[float]:
+    """Liest die Dauer aus Segment/Info einer Matroska-Datei"""
+    with open(path, 'rb') as f:
+        end = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset < end:
+            f.seek(offset)
+            header = _read_ebml_header(f)
+            if header is None:
+                return None
+            element_id, size, header_size = header
+
+            if element_id == _MKV_SEGMENT:
+                # In das Segment hineingehen, Info liegt vor den Clustern
+                offset += header_size
+                if size is not None:
+                    end = min(end, offset + size)
+                continue
+            if element_id == _MKV_CLUSTER or size is None:
+                return None
+            if element_id == _MKV_INFO:
+                # Info ist wenige Bytes groß - unplausible Größen deuten auf eine defekte Datei
+                if size > min(end - offset - header_size, 1 << 20):
+                    return None
+                info = f.read(size)
+                timecode_scale = 1000000
+                duration = None
+                pos = 0
+                while pos < len(info):
+                    child = _read_ebml_header(io.BytesIO(info[pos:pos + 16]))
+                    if child is None or child[1] is None:
+                        return None
+                    child_id, child_size, child_header = child
+                    data = info[pos + child_header:pos + child_header + child_size]
+                    if child_id == _MKV_TIMECODE_SCALE:
+                        timecode_scale = int.from_bytes(data, 'big')
+                    elif child_id == _MKV_DURATION and child_size in (4, 8):
+                        duration = struct.unpack('>f' if child_size == 4 else '>d', data)[0]
+                    pos += child_header + child_size
+                if not duration:
+                    return None
+                return duration * timecode_scale / 1e9
+            offset += header_size + size
+    return None
+
+
+# Container, deren Dauer ohne ffprobe aus dem Header gelesen werden kann
+_DURATION_READERS = {
+    '.mp4': _read_duration_mp4,
+    '.m4v': _read_duration_mp4,
+    '.mov': _read_duration_mp4,
+    '.mkv': _read_duration_mkv,
+}
+
 
 class CustomSpecialGenerator:
     def __init__(self, base_path: str, force_nfo: bool = False, force_thumb: bool = False,
-                 add_labels: bool = True, dry_run: bool = False):
+                 add_labels: bool = True, dry_run: bool = False, jobs: Optional[int] = None):
         self.base_path = Path(base_path)
         self.force_nfo = force_nfo
         self.force_thumb = force_thumb
-        self.add_labels = add_labels
+        # Ohne Pillow werden Labels gar nicht erst erkannt oder gezeichnet
+        self.add_labels = add_labels and PILLOW_AVAILABLE
+        self.labels_unavailable = add_labels and not PILLOW_AVAILABLE
         self.dry_run = dry_run
+        self.jobs = jobs or os.cpu_count() or 1
         self.processed_files = []
-        self.video_extensions = ['.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mov']
+        self.video_extensions = frozenset(('.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mov'))
 
         # Label-Keywords für Thumbnails
         self.label_keywords = {
@@ -50,18 +268,72 @@ class CustomSpecialGenerator:
             'insides': 'INSIDES',
             'inside': 'INSIDE',
         }
+        # Alle Keywords als eine Alternation mit benannten Gruppen, längste zuerst,
+        # damit z.B. 'inside the episode' vor 'inside' greift
+        keywords = sorted(self.label_keywords, key=len, reverse=True)
+        self._labels = [self.label_keywords[keyword] for keyword in keywords]
+        self._label_re = re.compile('|'.join(
+            f'(?P<k{i}>{re.escape(keyword)})' for i, keyword in enumerate(keywords)
+        ), re.IGNORECASE)
+
+    def is_special_video(self, name: str) -> bool:
+        """Prüft anhand des Dateinamens, ob es ein Special-Video >= E1000 ist"""
+        lower = name.lower()
+        dot = lower.rfind('.')
+        if dot <= 0 or lower[dot:] not in self.video_extensions:
+            return False
+        # Staffel 0 erfordert mindestens "s0" im Namen - spart die Regex für normale Folgen
+        if 's0' not in lower:
+            return False
+        ep_info = self.parse_episode_info(name[:dot])
+        return bool(ep_info and ep_info[0] == 0 and ep_info[1] >= 1000)
+
+    def needs_work(self, video_path: Path) -> bool:
+        """
+        Prüft ob ein Video noch organisiert werden muss oder NFO/Thumbnail/JSON fehlen
+        (einzige Prüfung zum Überspringen fertiger Videos, es gibt keinen Lauf-Cache)
+        """
+        if self.force_nfo or self.force_thumb:
+            return True
+        ep_info = self.parse_episode_info(video_path.stem)
+        if not ep_info or video_path.parent.name != self.get_episode_folder_name(*ep_info):
+            return True
+        return not (os.path.exists(self.get_nfo_path(video_path))
+                    and os.path.exists(self.get_thumb_path(video_path))
+                    and os.path.exists(self.get_json_path(video_path)))
+
+    def scan_directory(self, directory: str) -> Tuple[List[Path], List[str]]:
+        """
+        Liest ein einzelnes Verzeichnis per os.scandir
+        Returns: (Special-Videos, Unterverzeichnisse)
+        """
+        video_files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and self.is_special_video(entry.name):
+                        video_files.append(Path(entry.path))
+        except OSError as e:
+            print(f"⚠️  Fehler beim Lesen von {directory}: {e}")
+        return video_files, subdirs
 
     def find_video_files(self) -> List[Path]:
         """Findet rekursiv alle Video-Dateien für Special-Folgen >= E1000"""
         video_files = []
-        for root, dirs, files in os.walk(self.base_path):
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix.lower() in self.video_extensions:
-                    ep_info = self.parse_episode_info(file_path.stem)
-                    if ep_info and ep_info[0] == 0 and ep_info[1] >= 1000:
-                        video_files.append(file_path)
-        return video_files
+        # Verzeichnisse werden parallel gelesen, damit sich die Wartezeiten
+        # auf das Dateisystem (z.B. Netzwerk-Freigaben) überlappen
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pending = {executor.submit(self.scan_directory, str(self.base_path))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    video_files.extend(found)
+                    pending.update(executor.submit(self.scan_directory, subdir) for subdir in subdirs)
+        return sorted(video_files)
 
     def parse_episode_info(self, filename: str) -> Optional[Tuple[int, int, str]]:
         """
@@ -73,7 +345,7 @@ class CustomSpecialGenerator:
         Returns: (season, episode, title) oder None
         """
         # Pattern: Suche nach S00E1000, dann optional " - " und danach der Titel
-        match = re.search(r'[Ss](\d+)[Ee](\d+)(?:\s*-\s*(.+))?$', filename)
+        match = _EP_RE.search(filename)
         if match:
             season = int(match.group(1))
             episode = int(match.group(2))
@@ -141,7 +413,14 @@ class CustomSpecialGenerator:
                 print(f"   [DRY-RUN] Würde verschieben: {video_path.name} -> {folder_name}/")
             else:
                 try:
-                    shutil.move(str(video_path), str(new_video_path))
+                    # Zielordner liegt im selben Verzeichnis: ein einzelnes rename genügt
+                    try:
+                        os.replace(video_path, new_video_path)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        # Ordner liegt auf einem anderen Dateisystem (z.B. Mount-Point)
+                        shutil.move(str(video_path), str(new_video_path))
                     print(f"   ✓ Verschoben: {video_path.name} -> {folder_name}/")
                 except Exception as e:
                     print(f"   ⚠️  Fehler beim Verschieben: {e}")
@@ -165,12 +444,12 @@ class CustomSpecialGenerator:
 
     def load_json_metadata(self, json_path: Path) -> Optional[Dict]:
         """Lädt gespeicherte Metadaten aus JSON"""
-        if json_path.exists():
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️  Fehler beim Laden von {json_path}: {e}")
+        try:
+            return load_json(json_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️  Fehler beim Laden von {json_path}: {e}")
         return None
 
     def save_json_metadata(self, json_path: Path, data: Dict):
@@ -180,57 +459,83 @@ class CustomSpecialGenerator:
             return
 
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Eingerückt, da die Metadaten von Hand ergänzt werden (z.B. plot)
+            json_path.write_bytes(dump_json(data))
         except Exception as e:
             print(f"⚠️  Fehler beim Speichern von {json_path}: {e}")
 
-    def create_nfo(self, nfo_path: Path, season: int, episode: int, title: str, metadata: Optional[Dict] = None):
-        """Erstellt eine NFO-Datei für die Episode"""
+    def create_nfo(self, nfo_path: Path, season: int, episode: int, title: str,
+                   metadata: Optional[Dict] = None) -> bool:
+        """
+        Erstellt eine NFO-Datei für die Episode
+        Returns: True wenn die Datei geschrieben wurde
+        """
         if self.dry_run:
             print(f"   [DRY-RUN] Würde NFO erstellen: {nfo_path}")
-            return
-
-        # Root Element
-        root = ET.Element('episodedetails')
-
-        # Pflichtfelder aus Dateiname
-        ET.SubElement(root, 'title').text = title.replace("''", "")
-        ET.SubElement(root, 'season').text = str(season)
-        ET.SubElement(root, 'episode').text = str(episode)
-
-        # Zusätzliche Felder aus Metadaten (falls vorhanden)
-        if metadata:
-            if metadata.get('plot'):
-                ET.SubElement(root, 'plot').text = metadata['plot']
-            if metadata.get('aired'):
-                ET.SubElement(root, 'aired').text = metadata['aired']
-            if metadata.get('rating'):
-                ET.SubElement(root, 'rating').text = str(metadata['rating'])
-            if metadata.get('director'):
-                ET.SubElement(root, 'director').text = metadata['director']
-            if metadata.get('credits'):
-                for writer in metadata['credits']:
-                    ET.SubElement(root, 'credits').text = writer
-            if metadata.get('actors'):
-                for actor in metadata['actors']:
-                    actor_elem = ET.SubElement(root, 'actor')
-                    ET.SubElement(actor_elem, 'name').text = actor.get('name', '')
-                    if actor.get('role'):
-                        ET.SubElement(actor_elem, 'role').text = actor['role']
-
-        # Erstelle Tree und speichere
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space='  ')
+            return False
 
+        # Auch der Aufbau steht im try: von Hand editierte Metadaten (z.B. Zahl statt Text)
+        # sollen nur diese NFO scheitern lassen, nicht den ganzen Lauf
         try:
-            tree.write(nfo_path, encoding='utf-8', xml_declaration=True)
+            # Festes Schema mit wenigen Feldern: direkt als Text erzeugen statt über einen Element-Baum
+            lines = ["<?xml version='1.0' encoding='utf-8'?>", '<episodedetails>']
+
+            # Pflichtfelder aus Dateiname
+            lines.append(_xml_element('title', title.replace("''", "")))
+            lines.append(_xml_element('season', str(season)))
+            lines.append(_xml_element('episode', str(episode)))
+
+            # Zusätzliche Felder aus Metadaten (falls vorhanden)
+            if metadata:
+                if metadata.get('plot'):
+                    lines.append(_xml_element('plot', metadata['plot']))
+                if metadata.get('aired'):
+                    lines.append(_xml_element('aired', metadata['aired']))
+                if metadata.get('rating'):
+                    lines.append(_xml_element('rating', str(metadata['rating'])))
+                if metadata.get('director'):
+                    lines.append(_xml_element('director', metadata['director']))
+                if metadata.get('credits'):
+                    for writer in metadata['credits']:
+                        lines.append(_xml_element('credits', writer))
+                if metadata.get('actors'):
+                    for actor in metadata['actors']:
+                        lines.append('  <actor>')
+                        lines.append(_xml_element('name', actor.get('name', ''), '    '))
+                        if actor.get('role'):
+                            lines.append(_xml_element('role', actor['role'], '    '))
+                        lines.append('  </actor>')
+
+            lines.append('</episodedetails>')
+
+            nfo_path.write_bytes('\n'.join(lines).encode('utf-8'))
             print(f"   ✓ NFO erstellt: {nfo_path.name}")
+            return True
         except Exception as e:
             print(f"   ⚠️  Fehler beim Erstellen der NFO: {e}")
+            return False
 
     def get_video_duration(self, video_path: Path) -> Optional[float]:
         """Ermittelt die Dauer des Videos in Sekunden"""
+        # MP4/MOV/MKV: Dauer direkt aus dem Container-Header lesen
+        reader = _DURATION_READERS.get(video_path.suffix.lower())
+        if reader:
+            try:
+                duration = reader(video_path)
+                if duration:
+                    return duration
+            except (OSError, ValueError, struct.error):
+                pass
+
+        if PYAV_AVAILABLE:
+            # Liest nur den Container-Header, ohne ffprobe-Prozess
+            try:
+                with av.open(str(video_path)) as container:
+                    if container.duration:
+                        return container.duration / av.time_base
+            except Exception:
+                pass
+
         cmd = [
             'ffprobe',
             '-v', 'error',
@@ -243,7 +548,7 @@ class CustomSpecialGenerator:
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
 
@@ -255,52 +560,20 @@ class CustomSpecialGenerator:
 
         return None
 
-    def get_video_dimensions(self, video_path: Path) -> Optional[Tuple[int, int]]:
-        """Ermittelt die Auflösung des Videos (Breite x Höhe)"""
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height',
-            '-of', 'csv=s=x:p=0',
-            str(video_path)
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                output = result.stdout.decode().strip()
-                # Output format: "widthxheight" or "widthxheightx" (mit trailing x)
-                # Entferne leere Strings nach dem Split
-                parts = [p for p in output.split('x') if p]
-                if len(parts) >= 2:
-                    width, height = int(parts[0]), int(parts[1])
-                    return (width, height)
-        except:
-            pass
-
-        return None
-
     def detect_label(self, title: str) -> Optional[Tuple[Optional[str], str]]:
         """Erkennt ob der Titel ein Label-Keyword enthält und extrahiert ggf. Staffel/Season-Nummer und #Nummer"""
         title_lower = title.lower()
         season_prefix = ""
         # Staffel/Season-Nummer extrahieren
-        match = re.search(r'(staffel|season)\s*0*(\d+)', title_lower)
+        match = _STAFFEL_RE.search(title_lower)
         if match:
-            nummer = int(match.group(2))
+            nummer = int(match.group(1))
             season_prefix = f"S{nummer:02d}"
 
         # Episode-Nummer extrahieren
-        match = re.search(r'(episode)\s*0*(\d+)', title_lower)
+        match = _EPISODE_RE.search(title_lower)
         if match:
-            nummer = int(match.group(2))
+            nummer = int(match.group(1))
             if season_prefix:
                 season_prefix = f"{season_prefix}-E{nummer:02d}"
             else:
@@ -308,16 +581,17 @@ class CustomSpecialGenerator:
 
         # #Nummer extrahieren (z.B. #1, #05)
         number_suffix = ""
-        num_match = re.search(r'#\s*0*(\d+)', title_lower)
+        num_match = _HASH_RE.search(title_lower)
         if num_match:
             num = int(num_match.group(1))
             number_suffix = f" #{num:02d}"
 
-        for keyword, label in self.label_keywords.items():
-            if keyword in title_lower:
-                return season_prefix, f"{label}{number_suffix}"
+        keyword_match = self._label_re.search(title)
+        if keyword_match:
+            label = self._labels[int(keyword_match.lastgroup[1:])]
+            return season_prefix, f"{label}{number_suffix}"
 
-        match = re.search(r"''(.*?)''", title)
+        match = _QUOTED_RE.search(title)
         if match:
             new_label = match.group(1)
             return season_prefix, f"{new_label} {number_suffix}"
@@ -330,37 +604,23 @@ class CustomSpecialGenerator:
 
     def add_label_to_thumbnail(self, thumb_path: Path, label: str, season: Optional[str]) -> bool:
         """Fügt ein Label mit abgerundeten Ecken zum Thumbnail hinzu"""
-        if not PILLOW_AVAILABLE:
-            print(f"   ⚠️  Pillow nicht installiert, Label wird übersprungen")
-            print(f"      Installation: pip install Pillow")
-            return False
-
         if self.dry_run:
             print(f"   [DRY-RUN] Würde Label '{label}' hinzufügen")
             return True
 
         try:
-            # Lade Bild
+            # Lade Bild - ein RGBA-Draw auf einem RGB-Bild blendet die halbtransparenten
+            # Boxen direkt ein, ohne bildgroße Overlays und alpha_composite
             img = Image.open(thumb_path)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
             draw = ImageDraw.Draw(img, 'RGBA')
 
             # Berechne Schriftgröße relativ zur Bildhöhe (ca. 10% der Höhe)
             font_size = int(img.height * 0.06)
 
-            # Versuche Schrift zu laden
-            font = None
-            try:
-                # Versuche System-Schrift zu laden
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("arial.ttf", font_size)
-                except:
-                    try:
-                        font = ImageFont.truetype("Arial.ttf", font_size)
-                    except:
-                        # Fallback auf Default-Font
-                        font = ImageFont.load_default()
+            # Schrift wird pro Größe nur einmal geladen
+            font = _get_label_font(font_size)
 
             # Berechne Textgröße
             bbox = draw.textbbox((0, 0), label, font=font)
@@ -378,21 +638,13 @@ class CustomSpecialGenerator:
             box_width = text_width + (2 * padding)
             box_height = text_height + (2 * padding)
 
-            # Erstelle abgerundetes Rechteck mit transparentem schwarzen Hintergrund
-            overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-
-            # Zeichne abgerundetes Rechteck
-            overlay_draw.rounded_rectangle(
+            # Zeichne abgerundetes Rechteck mit transparentem schwarzen Hintergrund
+            draw.rounded_rectangle(
                 [box_x, box_y, box_x + box_width, box_y + box_height],
                 radius=border_radius,
                 fill=(0, 0, 0, 175)  # Schwarz mit Transparenz
             )
 
-            # Kombiniere Overlay mit Original
-            img = Image.alpha_composite(img.convert('RGBA'), overlay)
-            draw = ImageDraw.Draw(img)
-
             # Zeichne Text
             text_x = box_x + padding
             text_y = box_y + (padding * 0.5)
@@ -408,27 +660,18 @@ class CustomSpecialGenerator:
                 season_box_width = season_text_width + (2 * padding)
                 season_box_height = season_text_height + (2 * padding)
 
-                # Erstelle abgerundetes Rechteck mit transparentem schwarzen Hintergrund
-                season_overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-                season_overlay_draw = ImageDraw.Draw(season_overlay)
-
-                # Zeichne abgerundetes Rechteck
-                season_overlay_draw.rounded_rectangle(
+                # Zeichne abgerundetes Rechteck mit transparentem schwarzen Hintergrund
+                draw.rounded_rectangle(
                     [season_box_x, season_box_y, season_box_x + season_box_width, season_box_y + season_box_height],
                     radius=border_radius,
                     fill=(0, 0, 0, 175)  # Schwarz mit Transparenz
                 )
 
-                # Kombiniere Overlay mit Original
-                img = Image.alpha_composite(img.convert('RGBA'), season_overlay)
-                draw = ImageDraw.Draw(img)
-
                 season_text_x = img.width - season_text_width - (padding) - margin
                 season_text_y = margin + (padding * 0.5)
                 draw.text((season_text_x, season_text_y), season, font=font, fill=(255, 255, 255, 255))
 
             # Speichere
-            img = img.convert('RGB')  # Zurück zu RGB für JPEG
             img.save(thumb_path, 'JPEG', quality=95)
 
             print(f"   ✓ Label '{label}' hinzugefügt")
@@ -438,49 +681,91 @@ class CustomSpecialGenerator:
             print(f"   ⚠️  Fehler beim Hinzufügen des Labels: {e}")
             return False
 
-    def create_thumbnail(self, video_path: Path, thumb_path: Path, timestamp: Optional[str] = None) -> bool:
-        """Erstellt ein Thumbnail mit ffmpeg aus der Mitte des Videos"""
+    def extract_frame_pyav(self, video_path: Path, thumb_path: Path, timestamp: str) -> bool:
+        """Dekodiert mit PyAV den Frame am Timestamp und speichert ihn als 16:9 JPEG"""
+        try:
+            target = _parse_timestamp(timestamp)
+            with av.open(str(video_path)) as container:
+                stream = container.streams.video[0]
+                # Timestamp ist relativ zum Dateianfang wie bei ffmpeg -ss
+                # (z.B. DVB-Aufnahmen als .ts beginnen nicht bei 0)
+                start_time = container.start_time or 0
+                target_time = target + start_time / av.time_base
+                # Springt zum Keyframe vor dem Timestamp und dekodiert bis zum Ziel
+                frame = None
+                backoff = 0.0
+                while True:
+                    container.seek(int(max(target - backoff, 0) * av.time_base) + start_time)
+                    first = True
+                    for frame in container.decode(stream):
+                        if frame.time is None or frame.time >= target_time:
+                            break
+                        first = False
+                    # Ungenaues Seeking (z.B. MPEG-TS) landet evtl. hinter dem Ziel: weiter vorne neu ansetzen
+                    if (not first or frame is None or frame.time is None
+                            or frame.time <= target_time or backoff >= target):
+                        break
+                    backoff = backoff * 2 or 1.0
+                if frame is None:
+                    return False
+
+                img = frame.to_image()
+                # Rotation aus den Metadaten anwenden wie ffmpeg (z.B. Hochkant-Videos vom Handy);
+                # frame.rotation ist gegen den Uhrzeigersinn, wie bei Image.rotate
+                if frame.rotation:
+                    img = img.rotate(frame.rotation, expand=True)
+                # Berechne 16:9 Breite aus der Video-Höhe, auf gerade Zahl aufgerundet
+                target_width = int(img.height * 16 / 9)
+                if target_width % 2 != 0:
+                    target_width += 1
+                if img.width != target_width:
+                    img = img.resize((target_width, img.height), Image.Resampling.BICUBIC)
+                img.save(thumb_path, 'JPEG', quality=95)
+            return thumb_path.exists()
+        except Exception as e:
+            print(f"   ⚠️  PyAV Fehler: {e}")
+            return False
+
+    def create_thumbnail(self, video_path: Path, thumb_path: Path,
+                         timestamp: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Erstellt ein Thumbnail mit ffmpeg aus der Mitte des Videos
+        Returns: (Erfolg, verwendeter Timestamp)
+        """
         if self.dry_run:
             print(f"   [DRY-RUN] Würde Thumbnail erstellen: {thumb_path}")
-            return True
+            return True, timestamp
 
         # Wenn kein Timestamp angegeben, berechne Mitte des Videos
         if timestamp is None:
             duration = self.get_video_duration(video_path)
             if duration:
-                middle_seconds = duration / 2
-                hours = int(middle_seconds // 3600)
-                minutes = int((middle_seconds % 3600) // 60)
-                seconds = int(middle_seconds % 60)
-                timestamp = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                timestamp = _hms(duration / 2)
                 print(f"   Video-Dauer: {duration:.1f}s, Thumbnail bei: {timestamp}")
             else:
                 # Fallback wenn Dauer nicht ermittelt werden kann
                 timestamp = "00:00:05"
                 print(f"   ⚠️  Dauer nicht ermittelbar, verwende Fallback: {timestamp}")
 
-        # Ermittle Video-Dimensionen für 16:9 Berechnung
-        dimensions = self.get_video_dimensions(video_path)
-        if dimensions:
-            orig_width, orig_height = dimensions
-            # Berechne 16:9 Ziel-Dimensionen basierend auf Video-Höhe
-            target_width = int(orig_height * 16 / 9)
-            # Runde auf gerade Zahl für FFmpeg-Kompatibilität
-            if target_width % 2 != 0:
-                target_width += 1
-            print(f"   Video-Dimensionen: {orig_width}x{orig_height} → Thumbnail: {target_width}x{orig_height} (16:9)")
-        else:
-            # Fallback auf Full HD wenn Dimensionen nicht ermittelt werden können
-            target_width, orig_height = 1920, 1080
-            print(f"   ⚠️  Dimensionen nicht ermittelbar, verwende Fallback: {target_width}x{orig_height}")
+        # Mit PyAV wird der Frame direkt im Prozess dekodiert, ohne ffmpeg zu starten
+        if PYAV_AVAILABLE and PILLOW_AVAILABLE:
+            if self.extract_frame_pyav(video_path, thumb_path, timestamp):
+                print(f"   ✓ Thumbnail erstellt: {thumb_path.name}")
+                return True, timestamp
+            print(f"   ⚠️  PyAV konnte kein Thumbnail erstellen, verwende ffmpeg")
 
-        # ffmpeg Kommando mit Scale-Filter für 16:9
+        # ffmpeg Kommando: -ss vor -i sucht über den Index statt ab 0 zu dekodieren.
+        # Die 16:9 Breite wird von ffmpeg selbst aus der Video-Höhe berechnet
+        # (auf gerade Zahl aufgerundet), daher ist kein zusätzlicher ffprobe-Aufruf nötig.
         cmd = [
             'ffmpeg',
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel', 'error',
             '-ss', timestamp,
             '-i', str(video_path),
-            '-vf', f'scale={target_width}:{orig_height}',
-            '-vframes', '1',
+            '-vf', 'scale=2*ceil(trunc(ih*16/9)/2):ih',
+            '-frames:v', '1',
             '-q:v', '2',
             '-y',  # Überschreiben ohne Nachfrage
             str(thumb_path)
@@ -489,56 +774,55 @@ class CustomSpecialGenerator:
         try:
             result = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30
             )
 
             if result.returncode == 0 and thumb_path.exists():
                 print(f"   ✓ Thumbnail erstellt: {thumb_path.name}")
-                return True
+                return True, timestamp
             else:
                 print(f"   ⚠️  ffmpeg Fehler beim Erstellen des Thumbnails")
-                return False
+                return False, timestamp
 
         except subprocess.TimeoutExpired:
             print(f"   ⚠️  ffmpeg Timeout beim Erstellen des Thumbnails")
-            return False
+            return False, timestamp
         except FileNotFoundError:
             print(f"   ⚠️  ffmpeg nicht gefunden. Bitte installieren!")
-            return False
+            return False, timestamp
         except Exception as e:
             print(f"   ⚠️  Fehler beim Erstellen des Thumbnails: {e}")
-            return False
+            return False, timestamp
 
     def check_ffmpeg(self) -> bool:
         """Prüft ob ffmpeg und ffprobe verfügbar sind"""
-        try:
-            ffmpeg_result = subprocess.run(
-                ['ffmpeg', '-version'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5
-            )
-            ffprobe_result = subprocess.run(
-                ['ffprobe', '-version'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5
-            )
-            return ffmpeg_result.returncode == 0 and ffprobe_result.returncode == 0
-        except:
-            return False
+        return _ffmpeg_available()
+
+    def get_worker_options(self) -> Dict:
+        """Optionen, mit denen ein Worker-Prozess den Generator neu aufbaut"""
+        return {
+            'base_path': str(self.base_path),
+            'force_nfo': self.force_nfo,
+            'force_thumb': self.force_thumb,
+            'add_labels': self.add_labels,
+            'dry_run': self.dry_run,
+            'jobs': 1,
+        }
 
-    def process_video_file(self, video_path: Path):
-        """Verarbeitet eine einzelne Video-Datei"""
+    def process_video_file(self, video_path: Path) -> Optional[Path]:
+        """
+        Verarbeitet eine einzelne Video-Datei
+        Returns: Neuer Pfad des verarbeiteten Videos oder None wenn übersprungen
+        """
         print(f"\n📹 {video_path.name}")
 
         # SCHRITT 1: Organisiere in Ordner (zuerst!)
         new_video_path = self.organize_into_folder(video_path)
         if new_video_path is None:
             print(f"   ⚠️  Überspringe Datei wegen Fehler bei Ordner-Organisation")
-            return
+            return None
 
         # Ab jetzt mit dem neuen Pfad arbeiten
         video_path = new_video_path
@@ -547,9 +831,10 @@ class CustomSpecialGenerator:
         ep_info = self.parse_episode_info(video_path.stem)
         if not ep_info:
             print(f"   ⚠️  Konnte Episode-Info nicht parsen")
-            return
+            return None
 
         season, episode, title = ep_info
+        now = datetime.now()
         print(f"   Season: {season}, Episode: {episode}")
         print(f"   Titel: {title}")
 
@@ -561,9 +846,13 @@ class CustomSpecialGenerator:
         # Lade vorhandene JSON-Daten
         json_data = self.load_json_metadata(json_path)
 
+        # Existenz nur einmal prüfen und nach dem Erstellen lokal nachführen
+        nfo_exists = os.path.exists(nfo_path)
+        thumb_exists = os.path.exists(thumb_path)
+
         # Entscheide ob neu generiert werden soll
-        needs_nfo = self.force_nfo or not nfo_path.exists()
-        needs_thumb = self.force_thumb or not thumb_path.exists()
+        needs_nfo = self.force_nfo or not nfo_exists
+        needs_thumb = self.force_thumb or not thumb_exists
 
         if json_data and not self.force_nfo and not self.force_thumb:
             print(f"   📄 JSON-Metadaten gefunden")
@@ -573,12 +862,12 @@ class CustomSpecialGenerator:
             # Erstelle neue Metadaten
             metadata = {
                 'plot': '',  # Kann später manuell ergänzt werden
-                'aired': datetime.now().strftime('%Y-%m-%d'),
+                'aired': now.strftime('%Y-%m-%d'),
             }
 
         # Erstelle/Aktualisiere NFO
         if needs_nfo:
-            self.create_nfo(nfo_path, season, episode, title, metadata)
+            nfo_exists = self.create_nfo(nfo_path, season, episode, title, metadata) or nfo_exists
         else:
             print(f"   ✓ NFO existiert bereits: {nfo_path.name}")
 
@@ -592,7 +881,8 @@ class CustomSpecialGenerator:
             else:
                 timestamp = None  # Automatisch Mitte berechnen
 
-            success = self.create_thumbnail(video_path, thumb_path, timestamp)
+            success, used_timestamp = self.create_thumbnail(video_path, thumb_path, timestamp)
+            thumb_exists = success or thumb_exists
 
             # Füge Label hinzu falls gewünscht und erkannt
             if success and self.add_labels:
@@ -602,17 +892,8 @@ class CustomSpecialGenerator:
                     self.add_label_to_thumbnail(thumb_path, label_title, session_title)
 
             # Speichere verwendeten Timestamp für nächstes Mal
-            if success and timestamp is None:
-                # Berechne tatsächlich verwendeten Timestamp
-                duration = self.get_video_duration(video_path)
-                if duration:
-                    middle_seconds = duration / 2
-                    hours = int(middle_seconds // 3600)
-                    minutes = int((middle_seconds % 3600) // 60)
-                    seconds = int(middle_seconds % 60)
-                    timestamp = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                else:
-                    timestamp = "00:00:05"
+            if success:
+                timestamp = used_timestamp
         else:
             print(f"   ✓ Thumbnail existiert bereits: {thumb_path.name}")
             timestamp = json_data.get('thumbnail_timestamp') if json_data else None
@@ -625,13 +906,13 @@ class CustomSpecialGenerator:
             'title': title,
             'metadata': metadata,
             'thumbnail_timestamp': timestamp,
-            'nfo_created': nfo_path.exists(),
-            'thumb_created': thumb_path.exists(),
-            'last_processed': datetime.now().isoformat()
+            'nfo_created': nfo_exists,
+            'thumb_created': thumb_exists,
+            'last_processed': now.isoformat()
         }
 
         self.save_json_metadata(json_path, updated_json)
-        self.processed_files.append(video_path.name)
+        return video_path
 
     def process_all(self):
         """Hauptfunktion: Verarbeitet alle Video-Dateien"""
@@ -655,33 +936,67 @@ class CustomSpecialGenerator:
         print("📁 Ordner-Organisation: Aktiviert")
         print()
 
-        # Prüfe ffmpeg
+        # Prüfe ffmpeg (mit PyAV und Pillow nur als Fallback nötig)
         if not self.check_ffmpeg():
-            print("⚠️  WARNUNG: ffmpeg/ffprobe nicht gefunden!")
-            print("   Thumbnails können nicht erstellt werden.")
-            print("   Installation: https://ffmpeg.org/download.html\n")
+            if PYAV_AVAILABLE and PILLOW_AVAILABLE:
+                print("ℹ️  ffmpeg/ffprobe nicht gefunden - Thumbnails werden mit PyAV erstellt (ohne ffmpeg-Fallback)\n")
+            else:
+                print("⚠️  WARNUNG: ffmpeg/ffprobe nicht gefunden!")
+                print("   Thumbnails können nicht erstellt werden.")
+                print("   Installation: https://ffmpeg.org/download.html\n")
 
         # Prüfe Pillow für Labels
-        if self.add_labels and not PILLOW_AVAILABLE:
+        if self.labels_unavailable:
             print("⚠️  WARNUNG: Pillow nicht installiert!")
             print("   Labels können nicht hinzugefügt werden.")
             print("   Installation: pip install Pillow\n")
 
-        video_files = self.find_video_files()
+        found_files = self.find_video_files()
 
-        if not video_files:
+        if not found_files:
             print("ℹ️  Keine Custom Special Episodes gefunden")
             return
 
-        print(f"✓ {len(video_files)} Video-Datei(en) gefunden\n")
+        # Vorab-Durchlauf: Videos ohne offene Arbeit gar nicht erst an die Worker geben
+        video_files = [video_path for video_path in found_files if self.needs_work(video_path)]
+        skipped = len(found_files) - len(video_files)
 
-        for video_path in video_files:
-            self.process_video_file(video_path)
+        print(f"✓ {len(found_files)} Video-Datei(en) gefunden")
+        if skipped:
+            print(f"⏭️  {skipped} bereits vollständige Datei(en) übersprungen")
+        print()
+
+        # Jede Datei schreibt nur in ihren eigenen Episoden-Ordner,
+        # daher können die Videos unabhängig voneinander verarbeitet werden
+        if self.jobs > 1 and len(video_files) > 1:
+            worker = partial(_process_video_worker, self.get_worker_options())
+            results = []
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(video_files))) as executor:
+                # Ausgaben der Worker gesammelt und in Reihenfolge ausgeben, damit sie sich nicht mischen
+                for path, output in executor.map(worker, video_files):
+                    print(output, end='', flush=True)
+                    results.append(path)
+        else:
+            results = [self.process_video_file(video_path) for video_path in video_files]
+
+        self.processed_files.extend(path.name for path in results if path)
 
         print(f"\n{'='*60}")
         print(f"✅ Fertig! {len(self.processed_files)} Datei(en) verarbeitet")
 
 
+def _process_video_worker(options: Dict, video_path: Path) -> Tuple[Optional[Path], str]:
+    """
+    Worker für den Prozess-Pool: Baut den Generator neu auf und verarbeitet ein Video
+    Returns: (neuer Pfad oder None, gesammelte Ausgabe)
+    """
+    generator = CustomSpecialGenerator(**options)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        path = generator.process_video_file(video_path)
+    return path, output.getvalue()
+
+
 def main():
     import argparse
 
@@ -705,6 +1020,9 @@ Beispiele:
   # Testlauf
   python %(prog)s /pfad/zu/serien --dry-run
 
+  # Mit 4 parallelen Prozessen
+  python %(prog)s /pfad/zu/serien --jobs 4
+
 Dateiformat & Ordnerstruktur:
   Vorher:  "Serienname - S00E1001 - Episode Titel.mkv"
   Nachher: "S00E1001 - Episode Titel/Serienname - S00E1001 - Episode Titel.mkv"
@@ -728,6 +1046,8 @@ Dateiformat & Ordnerstruktur:
                        help='Keine Labels auf Thumbnails (Trailer, Interview, etc.)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Testlauf ohne Änderungen')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                       help='Anzahl paralleler Prozesse (Standard: Anzahl CPU-Kerne)')
 
     args = parser.parse_args()
 
@@ -745,7 +1065,8 @@ Dateiformat & Ordnerstruktur:
         force_nfo=force_nfo,
         force_thumb=force_thumb,
         add_labels=add_labels,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        jobs=args.jobs
     )
 
     if args.dry_run:
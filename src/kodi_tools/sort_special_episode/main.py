@@ -5,52 +5,184 @@ Sortiert Special-Folgen chronologisch zwischen normale Folgen basierend auf Auss
 """
 
 import os
-import json
-import xml.etree.ElementTree as ET
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, NamedTuple, Tuple, Optional
 import re
 
+from kodi_tools._jsonio import dump_json, load_json
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+
+_SE_RE = re.compile(r'[Ss](\d+)[Ee](\d+)')
+
+# Display-Tags für das direkte Patchen der NFO-Bytes
+_DS_RE = re.compile(rb'<displayseason>[^<]*</displayseason>')
+_DE_RE = re.compile(rb'<displayepisode>[^<]*</displayepisode>')
+_NFO_END = b'</episodedetails>'
+_XML_COMMENT_RE = re.compile(rb'<!--.*?-->', re.DOTALL)
+
+# Verzeichnisse ohne Episoden-NFOs (Bilder, NAS-Metadaten, Papierkorb); versteckte werden ebenfalls übersprungen
+_SKIP_DIRS = frozenset({'extrafanart', 'extrathumbs', '@eadir', '#recycle'})
+
+
+@lru_cache(maxsize=4096)
+def _parse_aired(text: str) -> datetime:
+    """Parst ein Datum im Format YYYY-MM-DD (viele Folgen teilen sich ein Datum)"""
+    return datetime.strptime(text, '%Y-%m-%d')
+
+
+_thread_state = threading.local()
+
+
+def _nfo_parser():
+    """Liefert einen wiederverwendbaren lxml-Parser pro Thread (lxml-Parser sind nicht threadsicher)"""
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        # Leerraum verwerfen, damit pretty_print auch neue Tags einrückt
+        parser = _thread_state.parser = ET.XMLParser(remove_blank_text=True)
+    return parser
+
+
+def _patch_display_tags(data: bytes, display_season: int, display_episode: int) -> Optional[bytes]:
+    """
+    Setzt displayseason/displayepisode direkt in den NFO-Bytes, ohne die Datei neu zu serialisieren
+
+    Returns:
+        Gepatchte Bytes oder None, wenn die NFO nicht dem üblichen Kodi-Aufbau entspricht
+    """
+    end = data.rfind(_NFO_END)
+    if end < 0 or data[end + len(_NFO_END):].strip() or b'<![CDATA[' in data:
+        return None
+    # Auskommentierte Display-Tags würden sonst statt der echten ersetzt
+    if b'<!--' in data and any(b'<display' in comment for comment in _XML_COMMENT_RE.findall(data)):
+        return None
+
+    tags = []
+    for pattern, tag in ((_DS_RE, b'<displayseason>%d</displayseason>' % display_season),
+                         (_DE_RE, b'<displayepisode>%d</displayepisode>' % display_episode)):
+        count = len(pattern.findall(data))
+        # Mehrfache, leere (<tag/>) oder Tags mit Attributen dem XML-Parser überlassen
+        if count > 1 or data.count(tag[:tag.index(b'>')]) != count:
+            return None
+        if count:
+            data = pattern.sub(tag, data)
+        else:
+            tags.append(tag)
+
+    if tags:
+        end = data.rfind(_NFO_END)
+        head = data[:end]
+        if head.endswith(b'\n'):
+            newline = b'\r\n' if head.endswith(b'\r\n') else b'\n'
+            insert = b''.join(b'  ' + tag + newline for tag in tags)
+        else:
+            insert = b''.join(tags)
+        data = head + insert + data[end:]
+    return data
+
+
+def _emit(msg: str, log: Optional[List[str]] = None):
+    """Gibt msg aus oder sammelt sie in log (Worker-Threads geben nicht selbst aus)"""
+    if log is None:
+        print(msg)
+    else:
+        log.append(msg)
+
+
+def _iter_nfo(path: str):
+    """Liefert rekursiv alle NFO-Dateien unterhalb von path (DirEntry-Typinfo statt stat)"""
+    try:
+        # Handle schließen, bevor in Unterverzeichnisse abgestiegen wird
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        # Wie os.walk: unlesbare Verzeichnisse stillschweigend überspringen
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith('.') and entry.name.lower() not in _SKIP_DIRS:
+                yield from _iter_nfo(entry.path)
+        elif entry.name.endswith('.nfo'):
+            yield Path(entry.path)
+
+
+class EpisodeEntry(NamedTuple):
+    """Eine Folge (normal oder Special) für die chronologische Sortierung"""
+    path: Path
+    season: int
+    episode: int
+    aired: datetime
+    is_special: bool
+    from_json: bool = False
+    json_data: Optional[Dict] = None
+
 
 class SpecialEpisodeManager:
-    def __init__(self, base_path: str, dry_run: bool = False):
+    def __init__(self, base_path: str, dry_run: bool = False, verbose: bool = False):
         self.base_path = Path(base_path)
         self.dry_run = dry_run
+        self.verbose = verbose
         self.processed_episodes = []
 
+    def iter_nfo_files(self):
+        """Liefert rekursiv alle NFO-Dateien, sobald sie gefunden werden"""
+        return _iter_nfo(str(self.base_path))
+
     def find_nfo_files(self) -> List[Path]:
         """Findet rekursiv alle NFO-Dateien"""
-        nfo_files = []
-        for root, dirs, files in os.walk(self.base_path):
-            for file in files:
-                if file.endswith('.nfo'):
-                    nfo_files.append(Path(root) / file)
-        return nfo_files
+        return list(self.iter_nfo_files())
 
     def parse_episode_info(self, filename: str) -> Optional[Tuple[int, int]]:
         """Extrahiert Season und Episode aus Dateinamen (z.B. S00E05 -> (0, 5))"""
-        match = re.search(r'[Ss](\d+)[Ee](\d+)', filename)
+        match = _SE_RE.search(filename)
         if match:
-            season = int(match.group(1))
-            episode = int(match.group(2))
-            return (season, episode)
+            return int(match.group(1)), int(match.group(2))
         return None
 
     def get_json_path(self, nfo_path: Path) -> Path:
         """Gibt den Pfad zur JSON-Backup-Datei zurück"""
         return nfo_path.with_suffix('.nfo.json')
 
-    def load_json_backup(self, json_path: Path) -> Optional[Dict]:
+    def load_json_backup(self, json_path: Path, log: Optional[List[str]] = None) -> Optional[Dict]:
         """Lädt gespeicherte Einstellungen aus JSON"""
-        if json_path.exists():
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️  Fehler beim Laden von {json_path}: {e}")
+        try:
+            return load_json(json_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _emit(f"⚠️  Fehler beim Laden von {json_path}: {e}", log)
         return None
 
+    def is_backup_current(self, nfo_path: Path, json_path: Path) -> bool:
+        """Prüft ob die NFO seit dem JSON-Backup nicht mehr verändert wurde (z.B. durch einen Scraper)"""
+        try:
+            return os.stat(nfo_path).st_mtime <= os.stat(json_path).st_mtime
+        except OSError:
+            return False
+
+    def get_json_aired(self, json_data: Dict) -> datetime:
+        """Liest das Ausstrahlungsdatum aus dem JSON-Backup (das Feld 'aired' darf von Hand geändert werden)"""
+        text = json_data['aired']
+        # YYYY-MM-DD direkt per fromisoformat, abweichende Schreibweisen (z.B. 2011-3-5) über strptime
+        if len(text) == 10:
+            try:
+                return datetime.fromisoformat(text)
+            except ValueError:
+                pass
+        return _parse_aired(text)
+
     def save_json_backup(self, json_path: Path, data: Dict):
         """Speichert Einstellungen in JSON"""
         if self.dry_run:
@@ -58,20 +190,63 @@ class SpecialEpisodeManager:
             return
 
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            json_path.write_bytes(dump_json(data))
         except Exception as e:
             print(f"⚠️  Fehler beim Speichern von {json_path}: {e}")
 
     def parse_nfo(self, nfo_path: Path) -> Optional[ET.ElementTree]:
         """Lädt und parsed eine NFO-Datei"""
         try:
-            tree: Any = ET.parse(nfo_path)
+            if LXML_AVAILABLE:
+                tree: Any = ET.parse(str(nfo_path), _nfo_parser())
+            else:
+                tree = ET.parse(nfo_path)
             return tree
         except Exception as e:
             print(f"⚠️  Fehler beim Parsen von {nfo_path}: {e}")
             return None
 
+    def scan_nfo_fields(self, nfo_path: Path, log: Optional[List[str]] = None) -> Optional[Tuple[Optional[datetime], Optional[int], Optional[int]]]:
+        """
+        Liest nur aired/season/episode aus der NFO, ohne den kompletten Baum aufzubauen
+
+        Returns:
+            (aired, season, episode) oder None bei Parse-Fehlern
+        """
+        fields: Dict[str, Optional[str]] = {}
+        depth = 0
+        try:
+            with open(nfo_path, 'rb') as f:
+                for event, elem in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    # Nur direkte Kinder des Wurzelelements zählen (wie root.find);
+                    # bis zum Ende lesen, damit Fehler hinter den Feldern gemeldet werden
+                    if depth == 1 and elem.tag in ('aired', 'season', 'episode'):
+                        fields.setdefault(elem.tag, elem.text)
+                    elem.clear()
+        except Exception as e:
+            _emit(f"⚠️  Fehler beim Parsen von {nfo_path}: {e}", log)
+            return None
+
+        aired = None
+        if fields.get('aired'):
+            try:
+                aired = _parse_aired(fields['aired'])
+            except ValueError:
+                pass
+
+        season = episode = None
+        if fields.get('season') and fields.get('episode'):
+            try:
+                season, episode = int(fields['season']), int(fields['episode'])
+            except (ValueError, TypeError):
+                pass
+
+        return aired, season, episode
+
     def get_aired_date(self, tree: ET.ElementTree) -> Optional[datetime]:
         """Extrahiert das Ausstrahlungsdatum aus der NFO"""
         root: ET.Element[str] | None = tree.getroot()
@@ -80,7 +255,7 @@ class SpecialEpisodeManager:
         aired = root.find('aired')
         if aired is not None and aired.text:
             try:
-                return datetime.strptime(aired.text, '%Y-%m-%d')
+                return _parse_aired(aired.text)
             except ValueError:
                 pass
         return None
@@ -100,6 +275,20 @@ class SpecialEpisodeManager:
                 pass
         return None
 
+    def get_display_tags(self, tree: ET.ElementTree) -> Optional[Tuple[int, int]]:
+        """Liest vorhandene displayseason/displayepisode Tags aus der NFO"""
+        root: ET.Element[str] | None = tree.getroot()
+        if root is None:
+            return None
+        ds_text = root.findtext('displayseason')
+        de_text = root.findtext('displayepisode')
+        if ds_text and de_text:
+            try:
+                return (int(ds_text), int(de_text))
+            except ValueError:
+                pass
+        return None
+
     def set_display_tags(self, tree: ET.ElementTree, display_season: int, display_episode: int):
         """Setzt oder aktualisiert displayseason und displayepisode Tags"""
         root: ET.Element[str] | None = tree.getroot()
@@ -125,86 +314,121 @@ class SpecialEpisodeManager:
             return
 
         try:
-            tree.write(nfo_path, encoding='utf-8', xml_declaration=True)
+            if LXML_AVAILABLE:
+                tree.write(str(nfo_path), encoding='utf-8', xml_declaration=True, pretty_print=True)
+            else:
+                tree.write(nfo_path, encoding='utf-8', xml_declaration=True)
         except Exception as e:
             print(f"⚠️  Fehler beim Speichern von {nfo_path}: {e}")
 
-    def process_special_episodes(self):
-        """Hauptfunktion: Verarbeitet alle Special-Folgen"""
-        print(f"🔍 Suche NFO-Dateien in: {self.base_path}")
-        nfo_files = self.find_nfo_files()
-        print(f"✓ {len(nfo_files)} NFO-Dateien gefunden\n")
+    def _scan_one(self, nfo_path: Path) -> Tuple[Optional[EpisodeEntry], List[str]]:
+        """
+        Liest eine NFO (bzw. deren JSON-Backup) ein, läuft in einem Worker-Thread
 
-        # Sammle alle Folgen (normale + specials)
-        all_episodes = []
-        specials_to_process = []
+        Returns:
+            (Episoden-Eintrag oder None, gesammelte Meldungen)
+        """
+        log: List[str] = []
 
-        for nfo_path in nfo_files:
-            # Prüfe ob es eine Episode ist
-            ep_info = self.parse_episode_info(nfo_path.name)
-            if not ep_info:
-                continue
+        # Prüfe ob es eine Episode ist
+        ep_info = self.parse_episode_info(nfo_path.name)
+        if not ep_info:
+            return None, log
 
-            season, episode = ep_info
+        season, episode = ep_info
 
-            # Parse NFO
-            tree: ET.ElementTree[ET.Element[str] | None] | None = self.parse_nfo(nfo_path)
-            if not tree:
-                continue
+        if season == 0:
+            # Ignoriere Folgen >= E10000
+            if episode >= 10000:
+                log.append(f"⏭️  Überspringe {nfo_path.name} (Episode >= 10000)")
+                return None, log
 
-            aired = self.get_aired_date(tree)
-
-            # Prüfe JSON-Backup für Specials
+            # Passt das JSON-Backup zum Dateinamen und ist die NFO seitdem unverändert,
+            # muss die NFO nicht gelesen werden
             json_path = self.get_json_path(nfo_path)
-            json_data = self.load_json_backup(json_path)
+            json_data = self.load_json_backup(json_path, log)
+            if (json_data and json_data.get('original_season') == season
+                    and json_data.get('original_episode') == episode
+                    and self.is_backup_current(nfo_path, json_path)):
+                if self.verbose:
+                    log.append(f"📄 Lade Special aus JSON: {nfo_path.name}")
+                return EpisodeEntry(nfo_path, season, episode, self.get_json_aired(json_data),
+                                    is_special=True, from_json=True, json_data=json_data), log
+
+        # Nur die benötigten Felder lesen, der Baum wird erst beim Schreiben geparst
+        fields = self.scan_nfo_fields(nfo_path, log)
+        if not fields:
+            return None, log
+
+        aired = fields[0]
+
+        if season == 0:
+            if not aired:
+                log.append(f"⚠️  Kein Ausstrahlungsdatum für Special: {nfo_path.name}")
+                return None, log
+
+            # Special-Folge ohne (passendes) JSON-Backup
+            return EpisodeEntry(nfo_path, season, episode, aired, is_special=True), log
+
+        # Normale Folge
+        if not aired:
+            log.append(f"⚠️  Kein Ausstrahlungsdatum für normale Episode: {nfo_path.name}")
+            return None, log
+
+        return EpisodeEntry(nfo_path, season, episode, aired, is_special=False), log
+
+    def save_nfo_bytes(self, nfo_path: Path, data: bytes):
+        """Speichert eine direkt gepatchte NFO-Datei"""
+        if self.dry_run:
+            print(f"   [DRY-RUN] Würde speichern: {nfo_path}")
+            return
 
-            if season == 0:
-                # Ignoriere Folgen >= E10000
-                if episode >= 10000:
-                    print(f"⏭️  Überspringe {nfo_path.name} (Episode >= 10000)")
-                    continue
+        try:
+            # Direkt in die Datei schreiben wie tree.write: folgt Symlinks, erhält Hardlinks
+            # und scheitert an schreibgeschützten NFOs
+            nfo_path.write_bytes(data)
+        except Exception as e:
+            print(f"⚠️  Fehler beim Speichern von {nfo_path}: {e}")
 
-                if not aired:
-                    print(f"⚠️  Kein Ausstrahlungsdatum für Special: {nfo_path.name}")
-                    continue
+    def scan_nfo_files(self):
+        """
+        Liest alle NFOs parallel ein, während das Verzeichnis noch durchsucht wird
+        Liefert (Episoden-Eintrag oder None, Meldungen) in Dateireihenfolge
+        """
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        # Nur begrenzt viele Dateien gleichzeitig in Arbeit halten, statt für jede NFO vorab einen Future anzulegen
+        max_pending = max_workers * 4
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for nfo_path in self.iter_nfo_files():
+                pending.append(executor.submit(self._scan_one, nfo_path))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
-                # Special-Folge
-                if json_data:
-                    print(f"📄 Lade Special aus JSON: {nfo_path.name}")
-                    specials_to_process.append({
-                        'path': nfo_path,
-                        'season': season,
-                        'episode': episode,
-                        'aired': datetime.strptime(json_data['aired'], '%Y-%m-%d'),
-                        'tree': tree,
-                        'is_special': True,
-                        'from_json': True,
-                        'json_data': json_data
-                    })
-                else:
-                    specials_to_process.append({
-                        'path': nfo_path,
-                        'season': season,
-                        'episode': episode,
-                        'aired': aired,
-                        'tree': tree,
-                        'is_special': True,
-                        'from_json': False
-                    })
+    def process_special_episodes(self):
+        """Hauptfunktion: Verarbeitet alle Special-Folgen"""
+        print(f"🔍 Suche NFO-Dateien in: {self.base_path}\n")
+        nfo_count = 0
+
+        # Sammle alle Folgen (normale + specials)
+        all_episodes = []
+        specials_to_process = []
+
+        # Meldungen und Listen werden im Hauptthread in Dateireihenfolge verarbeitet
+        for entry, log in self.scan_nfo_files():
+            nfo_count += 1
+            if log:
+                print('\n'.join(log))
+            if not entry:
+                continue
+            if entry.is_special:
+                specials_to_process.append(entry)
             else:
-                # Normale Folge
-                if not aired:
-                    print(f"⚠️  Kein Ausstrahlungsdatum für normale Episode: {nfo_path.name}")
-                    continue
+                all_episodes.append(entry)
 
-                all_episodes.append({
-                    'path': nfo_path,
-                    'season': season,
-                    'episode': episode,
-                    'aired': aired,
-                    'tree': tree,
-                    'is_special': False
-                })
+        print(f"✓ {nfo_count} NFO-Dateien gefunden")
 
         if not specials_to_process:
             print("ℹ️  Keine Special-Folgen zum Verarbeiten gefunden")
@@ -213,8 +437,8 @@ class SpecialEpisodeManager:
         # Füge Specials zu allen Episoden hinzu
         all_episodes.extend(specials_to_process)
 
-        # Sortiere alle Folgen nach Ausstrahlungsdatum
-        all_episodes.sort(key=lambda x: (x['aired'] if x['aired'] else datetime.max, x['season'], x['episode']))
+        # Sortiere alle Folgen nach Ausstrahlungsdatum (Folgen ohne Datum wurden bereits aussortiert)
+        all_episodes.sort(key=attrgetter('aired', 'season', 'episode'))
 
         print(f"\n📺 Verarbeite {len(specials_to_process)} Special-Folgen zwischen {len(all_episodes) - len(specials_to_process)} normalen Folgen\n")
 
@@ -224,8 +448,8 @@ class SpecialEpisodeManager:
 
         for ep in all_episodes:
             # Wenn wir zu einer neuen Staffel wechseln (nur bei normalen Folgen)
-            if not ep['is_special'] and ep['season'] != current_season:
-                current_season = ep['season']
+            if not ep.is_special and ep.season != current_season:
+                current_season = ep.season
                 episode_counter = 0
 
             if not current_season:
@@ -234,46 +458,70 @@ class SpecialEpisodeManager:
             episode_counter += 1
 
             # Nur Specials bearbeiten
-            if ep['is_special']:
-                nfo_path = ep['path']
-                tree = ep['tree']
-                if not tree:
-                    continue
+            if ep.is_special:
+                nfo_path = ep.path
 
                 # Wenn aus JSON geladen und sich nichts geändert hat, überspringe
-                if ep['from_json']:
-                    old_display_season = ep['json_data'].get('display_season')
-                    old_display_episode = ep['json_data'].get('display_episode')
+                if ep.from_json:
+                    old_display_season = ep.json_data.get('display_season')
+                    old_display_episode = ep.json_data.get('display_episode')
 
                     if old_display_season == current_season and old_display_episode == episode_counter:
                         print(f"✓ {nfo_path.name} (bereits korrekt: S{current_season:02d}E{episode_counter:02d})")
                         continue
 
-                print(f"✏️  {nfo_path.name}")
-                print(f"   Original: S{ep['season']:02d}E{ep['episode']:02d}")
-                print(f"   Ausgestrahlt: {ep['aired'].strftime('%Y-%m-%d')}")
-                print(f"   → Display: S{current_season:02d}E{episode_counter:02d}")
+                try:
+                    data = nfo_path.read_bytes()
+                except OSError as e:
+                    print(f"⚠️  Fehler beim Lesen von {nfo_path}: {e}")
+                    continue
 
-                # Setze Tags
-                self.set_display_tags(tree, current_season, episode_counter)
-                self.save_nfo(tree, nfo_path)
+                # Normalfall: Tags direkt in den Bytes setzen, sonst über den XML-Baum
+                tree = None
+                patched = _patch_display_tags(data, current_season, episode_counter)
+                if patched is None:
+                    tree = self.parse_nfo(nfo_path)
+                    if not tree:
+                        continue
+                    nfo_correct = self.get_display_tags(tree) == (current_season, episode_counter)
+                else:
+                    nfo_correct = patched == data
 
-                # Speichere JSON-Backup
                 json_data = {
-                    'original_season': ep['season'],
-                    'original_episode': ep['episode'],
-                    'aired': ep['aired'].strftime('%Y-%m-%d'),
+                    'original_season': ep.season,
+                    'original_episode': ep.episode,
+                    'aired': ep.aired.strftime('%Y-%m-%d'),
                     'display_season': current_season,
                     'display_episode': episode_counter,
                     'last_modified': datetime.now().isoformat()
                 }
+
+                # NFO bereits korrekt (z.B. von Hand gepflegt): nur das JSON-Backup anlegen
+                if nfo_correct:
+                    print(f"✓ {nfo_path.name} (NFO bereits korrekt: S{current_season:02d}E{episode_counter:02d})")
+                    self.save_json_backup(self.get_json_path(nfo_path), json_data)
+                    continue
+
+                print(f"✏️  {nfo_path.name}")
+                print(f"   Original: S{ep.season:02d}E{ep.episode:02d}")
+                print(f"   Ausgestrahlt: {ep.aired.strftime('%Y-%m-%d')}")
+                print(f"   → Display: S{current_season:02d}E{episode_counter:02d}")
+
+                # Setze Tags
+                if tree is None:
+                    self.save_nfo_bytes(nfo_path, patched)
+                else:
+                    self.set_display_tags(tree, current_season, episode_counter)
+                    self.save_nfo(tree, nfo_path)
+
+                # Speichere JSON-Backup
                 self.save_json_backup(self.get_json_path(nfo_path), json_data)
 
                 self.processed_episodes.append(nfo_path.name)
                 print()
             else:
                 # Normale Folge - nur zur Info
-                print(f"   S{ep['season']:02d}E{ep['episode']:02d} → Display: S{current_season:02d}E{episode_counter:02d} ({ep['aired'].strftime('%Y-%m-%d')})")
+                print(f"   S{ep.season:02d}E{ep.episode:02d} → Display: S{current_season:02d}E{episode_counter:02d} ({ep.aired.strftime('%Y-%m-%d')})")
 
         print(f"\n✅ Fertig! {len(self.processed_episodes)} Special-Folgen verarbeitet")
 
@@ -286,6 +534,8 @@ def main():
     )
     parser.add_argument('path', help='Basis-Pfad zum rekursiven Durchsuchen')
     parser.add_argument('--dry-run', action='store_true', help='Testlauf ohne Änderungen')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Auch aus JSON geladene Specials beim Einlesen ausgeben')
 
     args = parser.parse_args()
 
@@ -293,7 +543,7 @@ def main():
         print(f"❌ Pfad existiert nicht: {args.path}")
         return
 
-    manager = SpecialEpisodeManager(args.path, dry_run=args.dry_run)
+    manager = SpecialEpisodeManager(args.path, dry_run=args.dry_run, verbose=args.verbose)
 
     if args.dry_run:
         print("🧪 DRY-RUN Modus - Es werden keine Änderungen vorgenommen\n")